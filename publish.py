@@ -6,16 +6,23 @@ Usage:
     python3 publish.py posts/YYYY-MM-DD-slug.md           # Publish to site
     python3 publish.py posts/YYYY-MM-DD-slug.md --substack  # Output for Substack
     python3 publish.py --rss                               # Regenerate RSS only
-    python3 publish.py --rebuild                           # Rebuild all posts
+    python3 publish.py --rebuild                           # Rebuild changed posts
+    python3 publish.py --rebuild --force                   # Rebuild all posts
 """
 
 import sys
 import os
 import re
+import hashlib
 import html
+import io
+import json
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 # Configuration
 SITE_ROOT = Path(__file__).parent
@@ -24,10 +31,67 @@ THOUGHTS_DIR = SITE_ROOT / "thoughts"
 TEMPLATES_DIR = SITE_ROOT / "templates"
 INDEX_FILE = SITE_ROOT / "index.html"
 FEED_FILE = SITE_ROOT / "feed.xml"
+CACHE_DIR = SITE_ROOT / ".cache"
+META_CACHE_FILE = CACHE_DIR / "meta.json"
+LISTINGS_STATE_FILE = CACHE_DIR / "listings.json"
+BUILD_STAMP_FILE = CACHE_DIR / "rendered.json"
 
 SITE_URL = "https://sotoalt.dev"
 SITE_TITLE = "sotoalt"
 SITE_DESCRIPTION = "thoughts, experiments, and rabbit holes"
+_SITE_TITLE_ESC = html.escape(SITE_TITLE)
+_SITE_DESCRIPTION_ESC = html.escape(SITE_DESCRIPTION)
+
+# RSS boilerplate around <lastBuildDate> and the items
+_RSS_HEADER = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>{_SITE_TITLE_ESC}</title>
+    <link>{SITE_URL}</link>
+    <description>{_SITE_DESCRIPTION_ESC}</description>
+    <language>en-us</language>
+"""
+_RSS_ATOM_LINK = f"""    <atom:link href="{SITE_URL}/feed.xml" rel="self" type="application/rss+xml"/>
+"""
+_RSS_FOOTER = """
+  </channel>
+</rss>"""
+
+# Precompiled patterns
+# Inline markdown in one alternation: code, bold (** / __), italic (* / _), link.
+# Italic may wrap a bold span of the same marker, e.g. *a **b** c*.
+_RE_INLINE = re.compile(
+    r'`([^`]+)`'
+    r'|\*\*([^*]+)\*\*|__([^_]+)__'
+    r'|\*((?:[^*]|\*\*[^*]+\*\*)+)\*|_((?:[^_]|__[^_]+__)+)_'
+    r'|\[([^\]]+)\]\(([^)]+)\)'
+)
+_RE_FENCE = re.compile(r'^```[^\n]*\n?', re.MULTILINE)
+_RE_BLANK_LINES = re.compile(r'\n\s*\n')
+_RE_IMAGE = re.compile(r'!\[(.*)\]\((.*)\)')
+_RE_DATE_PREFIX = re.compile(r'(\d{4}-\d{2}-\d{2})-')
+_RE_SLUG = re.compile(r'\d{4}-\d{2}-\d{2}-(.+)')
+_RE_HTML_TITLE = re.compile(r'<title>([^<]+) / sotoalt</title>')
+_RE_HTML_DESC = re.compile(r'<meta name="description" content="([^"]*)"')
+_RE_HTML_DATE = re.compile(r'<p class="meta">(\d{4})\.(\d{2})')
+_RE_TEMPLATE = re.compile(r'\{\{(title|description|slug|date_display|reading_time|content)\}\}')
+
+# Same output as html.escape(quote=True), in a single translate pass
+_HTML_ESC_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;"
+})
+
+# Characters that can start inline markup; text without them is escaped only
+_INLINE_METACHARS = ("*", "_", "`", "[")
+
+# Line prefixes used by the block parser
+_HR_MARKERS = ("---", "***", "___")
+_LIST_MARKERS = ("- ", "* ")
+_PARA_BREAKS = ("#", "-", "*", ">", "```", "![", "---", "***", "___")
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -41,113 +105,121 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
 
     frontmatter = {}
     for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            frontmatter[key.strip()] = value.strip().strip('"').strip("'")
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        value = value.strip()
+        # Drop one pair of matching surrounding quotes
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        frontmatter[key.strip()] = value
 
     return frontmatter, parts[2].strip()
 
 
-def markdown_to_html(md: str) -> str:
-    """Convert markdown to HTML. Simple parser, no dependencies."""
-    lines = md.split("\n")
-    html_lines = []
-    in_list = False
-    in_code = False
-    code_block = []
-
-    i = 0
-    while i < len(lines):
+def _block_to_html(lines: list[str], html_lines: list[str]):
+    """Render one blank-line-separated block of markdown lines."""
+    i, n = 0, len(lines)
+    while i < n:
         line = lines[i]
+        stripped = line.strip()
+        i += 1
 
-        # Code blocks
-        if line.startswith("```"):
-            if in_code:
-                html_lines.append(f'<pre><code>{html.escape(chr(10).join(code_block))}</code></pre>')
-                code_block = []
-                in_code = False
-            else:
-                in_code = True
-            i += 1
-            continue
-
-        if in_code:
-            code_block.append(line)
-            i += 1
+        if not stripped:
             continue
 
-        # Close list if needed
-        if in_list and not line.strip().startswith("- ") and not line.strip().startswith("* "):
-            html_lines.append("</ul>")
-            in_list = False
-
         # Headers
         if line.startswith("# "):
             # Skip h1 as we use it in the template
-            i += 1
             continue
         elif line.startswith("## "):
             html_lines.append(f'<h2>{process_inline(line[3:])}</h2>')
         elif line.startswith("### "):
             html_lines.append(f'<h3>{process_inline(line[4:])}</h3>')
         # Horizontal rule
-        elif line.strip() in ("---", "***", "___"):
+        elif stripped in _HR_MARKERS:
             html_lines.append("<hr>")
-        # Lists
-        elif line.strip().startswith("- ") or line.strip().startswith("* "):
-            if not in_list:
-                html_lines.append("<ul>")
-                in_list = True
-            item = line.strip()[2:]
-            html_lines.append(f'<li>{process_inline(item)}</li>')
+        # Lists (consecutive items form one list)
+        elif stripped.startswith(_LIST_MARKERS):
+            html_lines.append("<ul>")
+            html_lines.append(f'<li>{process_inline(stripped[2:])}</li>')
+            while i < n and (item := lines[i].strip()).startswith(_LIST_MARKERS):
+                html_lines.append(f'<li>{process_inline(item[2:])}</li>')
+                i += 1
+            html_lines.append("</ul>")
         # Blockquotes
         elif line.startswith("> "):
             html_lines.append(f'<blockquote><p>{process_inline(line[2:])}</p></blockquote>')
         # Images
-        elif re.match(r'!\[.*\]\(.*\)', line):
-            match = re.match(r'!\[(.*)\]\((.*)\)', line)
-            if match:
-                alt, src = match.groups()
-                html_lines.append(f'<figure><img src="{src}" alt="{alt}"><figcaption>{alt}</figcaption></figure>')
-        # Empty line
-        elif not line.strip():
-            html_lines.append("")
-        # Paragraph
+        elif match := _RE_IMAGE.match(line):
+            alt, src = match.groups()
+            html_lines.append(f'<figure><img src="{src}" alt="{alt}"><figcaption>{alt}</figcaption></figure>')
+        # Paragraph (runs until a line that starts another element)
         else:
-            # Collect multi-line paragraphs
             para_lines = [line]
-            while i + 1 < len(lines) and lines[i + 1].strip() and not lines[i + 1].startswith(("#", "-", "*", ">", "```", "![", "---", "***", "___")):
-                i += 1
+            while i < n and lines[i].strip() and not lines[i].startswith(_PARA_BREAKS):
                 para_lines.append(lines[i])
+                i += 1
             html_lines.append(f'<p>{process_inline(" ".join(para_lines))}</p>')
 
-        i += 1
 
-    # Close any open list
-    if in_list:
-        html_lines.append("</ul>")
+def markdown_to_html(md: str) -> str:
+    """Convert markdown to HTML. Simple parser, no dependencies."""
+    html_lines = []
+
+    # Splitting on fence lines alternates text and code segments;
+    # an unterminated fence (odd last segment) is dropped
+    parts = _RE_FENCE.split(md)
+    if len(parts) % 2 == 0:
+        parts.pop()
+
+    for n, part in enumerate(parts):
+        if n % 2:
+            code = part[:-1] if part.endswith("\n") else part
+            html_lines.append(f'<pre><code>{code.translate(_HTML_ESC_TABLE)}</code></pre>')
+            continue
+
+        for j, block in enumerate(_RE_BLANK_LINES.split(part)):
+            if j:
+                html_lines.append("")
+            _block_to_html(block.split("\n"), html_lines)
 
     return "\n                ".join(html_lines)
 
 
-def process_inline(text: str) -> str:
-    """Process inline markdown: bold, italic, links, code."""
-    # Escape HTML first
-    text = html.escape(text)
+def _inline_sub(match: re.Match) -> str:
+    """Render a single inline markdown match from _RE_INLINE."""
+    code, bold_star, bold_und, em_star, em_und, link_text, link_href = match.groups()
 
-    # Code (backticks)
-    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    # Code (backticks): contents are left as-is
+    if code is not None:
+        return f'<code>{code}</code>'
 
-    # Bold
-    text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'__([^_]+)__', r'<strong>\1</strong>', text)
+    # Bold / italic / link text may nest other inline markup
+    if bold_star is not None or bold_und is not None:
+        inner = bold_star if bold_star is not None else bold_und
+        return f'<strong>{_RE_INLINE.sub(_inline_sub, inner)}</strong>'
 
     # Italic (use em for accent color per site style)
-    text = re.sub(r'\*([^*]+)\*', r'<em>\1</em>', text)
-    text = re.sub(r'_([^_]+)_', r'<em>\1</em>', text)
+    if em_star is not None or em_und is not None:
+        inner = em_star if em_star is not None else em_und
+        return f'<em>{_RE_INLINE.sub(_inline_sub, inner)}</em>'
 
     # Links
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+    return f'<a href="{link_href}">{_RE_INLINE.sub(_inline_sub, link_text)}</a>'
+
+
+def process_inline(text: str) -> str:
+    """Process inline markdown: bold, italic, links, code."""
+    # Fast path: plain prose has nothing to substitute
+    if "--" not in text and not any(c in text for c in _INLINE_METACHARS):
+        return text.translate(_HTML_ESC_TABLE)
+
+    # Escape HTML first
+    text = text.translate(_HTML_ESC_TABLE)
+
+    # Code, bold, italic and links in a single scan
+    text = _RE_INLINE.sub(_inline_sub, text)
 
     # Em dash
     text = text.replace("--", "&mdash;")
@@ -161,6 +233,7 @@ def estimate_reading_time(text: str) -> int:
     return max(1, round(words / 200))
 
 
+@lru_cache(maxsize=1024)
 def format_date_display(date_str: str) -> str:
     """Format date for display (YYYY.MM)."""
     try:
@@ -170,6 +243,7 @@ def format_date_display(date_str: str) -> str:
         return date_str
 
 
+@lru_cache(maxsize=1024)
 def format_date_rss(date_str: str) -> str:
     """Format date for RSS (RFC 822)."""
     try:
@@ -183,22 +257,48 @@ def get_slug_from_filename(filename: str) -> str:
     """Extract slug from filename (YYYY-MM-DD-slug.md -> slug)."""
     name = Path(filename).stem
     # Remove date prefix if present
-    match = re.match(r'\d{4}-\d{2}-\d{2}-(.+)', name)
+    match = _RE_SLUG.match(name)
     if match:
         return match.group(1)
     return name
 
 
-def publish_post(md_file: Path, substack: bool = False) -> dict:
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content to path unless the file already holds it. Returns True if written."""
+    new_bytes = content.encode()
+    if path.exists() and path.stat().st_size == len(new_bytes) and path.read_bytes() == new_bytes:
+        return False
+
+    tmp_file = path.with_name(path.name + ".tmp")
+    tmp_file.write_bytes(new_bytes)
+    os.replace(tmp_file, path)
+    return True
+
+
+def load_template() -> str:
+    """Read the post template, exiting if it is missing."""
+    template_file = TEMPLATES_DIR / "post.html"
+    if not template_file.exists():
+        print(f"Error: Template not found at {template_file}")
+        sys.exit(1)
+
+    return template_file.read_text()
+
+
+def publish_post(md_file: Path, substack: bool = False, template: Optional[str] = None) -> dict:
     """Publish a markdown post to HTML."""
     content = md_file.read_text()
     frontmatter, body = parse_frontmatter(content)
 
-    # Extract metadata
-    title = frontmatter.get("title", get_slug_from_filename(md_file.name).replace("-", " "))
-    date = frontmatter.get("date", datetime.now().strftime("%Y-%m-%d"))
-    description = frontmatter.get("description", "")
+    # Extract metadata (fallbacks only computed when the key is missing)
     slug = get_slug_from_filename(md_file.name)
+    title = frontmatter.get("title")
+    if title is None:
+        title = slug.replace("-", " ")
+    date = frontmatter.get("date")
+    if date is None:
+        date = datetime.now().strftime("%Y-%m-%d")
+    description = frontmatter.get("description", "")
 
     # Convert markdown to HTML
     html_content = markdown_to_html(body)
@@ -227,26 +327,27 @@ def publish_post(md_file: Path, substack: bool = False) -> dict:
             "slug": slug
         }
 
-    # Load template
-    template_file = TEMPLATES_DIR / "post.html"
-    if not template_file.exists():
-        print(f"Error: Template not found at {template_file}")
-        sys.exit(1)
-
-    template = template_file.read_text()
+    # Load template unless the caller already has it
+    if template is None:
+        template = load_template()
 
-    # Fill template
-    html_output = template.replace("{{title}}", title)
-    html_output = html_output.replace("{{description}}", description)
-    html_output = html_output.replace("{{slug}}", slug)
-    html_output = html_output.replace("{{date_display}}", format_date_display(date))
-    html_output = html_output.replace("{{reading_time}}", str(reading_time))
-    html_output = html_output.replace("{{content}}", html_content)
+    # Fill template in a single pass
+    values = {
+        "title": title,
+        "description": description,
+        "slug": slug,
+        "date_display": format_date_display(date),
+        "reading_time": str(reading_time),
+        "content": html_content
+    }
+    html_output = _RE_TEMPLATE.sub(lambda m: values[m.group(1)], template)
 
-    # Write output
+    # Write output (skip if identical to what is already on disk)
     output_file = THOUGHTS_DIR / f"{slug}.html"
-    output_file.write_text(html_output)
-    print(f"Published: {output_file}")
+    if write_if_changed(output_file, html_output):
+        print(f"Published: {output_file}")
+    else:
+        print(f"Unchanged: {output_file}")
 
     return {
         "title": title,
@@ -263,15 +364,15 @@ def extract_metadata_from_html(html_file: Path) -> dict:
     slug = html_file.stem
 
     # Extract title from <title> tag
-    title_match = re.search(r'<title>([^<]+) / sotoalt</title>', content)
+    title_match = _RE_HTML_TITLE.search(content)
     title = title_match.group(1) if title_match else slug.replace("-", " ")
 
     # Extract description from meta tag
-    desc_match = re.search(r'<meta name="description" content="([^"]*)"', content)
+    desc_match = _RE_HTML_DESC.search(content)
     description = desc_match.group(1) if desc_match else ""
 
     # Extract date from meta (format: YYYY.MM)
-    date_match = re.search(r'<p class="meta">(\d{4})\.(\d{2})', content)
+    date_match = _RE_HTML_DATE.search(content)
     if date_match:
         year, month = date_match.groups()
         date = f"{year}-{month}-01"
@@ -280,53 +381,128 @@ def extract_metadata_from_html(html_file: Path) -> dict:
 
     return {
         "title": title,
+        "title_esc": title.translate(_HTML_ESC_TABLE),
         "date": date,
         "description": description,
+        "description_esc": description.translate(_HTML_ESC_TABLE),
         "slug": slug,
         "file": html_file,
         "source": "html"
     }
 
 
+def script_mtime() -> float:
+    """Modification time of publish.py; a newer script invalidates cached build state."""
+    return Path(__file__).stat().st_mtime
+
+
+def write_cache_file(path: Path, text: str):
+    """Write a file under .cache/, creating the directory on first use."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def load_meta_cache() -> dict:
+    """Load cached markdown post metadata, keyed by source filename.
+
+    The whole cache is dropped if it was written by a different publish.py.
+    """
+    try:
+        data = json.loads(META_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != script_mtime():
+        return {}
+    return data.get("posts", {})
+
+
+def save_meta_cache(cache: dict):
+    """Persist markdown post metadata cache, tagged with the current publish.py version."""
+    data = {"version": script_mtime(), "posts": cache}
+    write_cache_file(META_CACHE_FILE, json.dumps(data, indent=2, sort_keys=True))
+
+
+def extract_metadata_from_markdown(md_file: Path) -> dict:
+    """Extract title, date, and description from a markdown post's frontmatter."""
+    # Only the frontmatter is needed, so avoid reading the whole body
+    with md_file.open() as f:
+        head = f.read(4096)
+        if head.startswith("---") and head.find("---", 3) < 0:
+            head += f.read()
+    frontmatter, _ = parse_frontmatter(head)
+
+    slug = get_slug_from_filename(md_file.name)
+    date = frontmatter.get("date", "")
+
+    # Try to extract date from filename if not in frontmatter
+    if not date:
+        match = _RE_DATE_PREFIX.match(md_file.name)
+        if match:
+            date = match.group(1)
+        else:
+            date = "1970-01-01"
+
+    title = frontmatter.get("title", slug.replace("-", " "))
+    description = frontmatter.get("description", "")
+
+    # Escaped forms are cached alongside so RSS generation needn't escape again
+    return {
+        "title": title,
+        "title_esc": title.translate(_HTML_ESC_TABLE),
+        "date": date,
+        "description": description,
+        "description_esc": description.translate(_HTML_ESC_TABLE),
+        "slug": slug
+    }
+
+
+def scan_files(directory: Path, suffix: str) -> list[os.DirEntry]:
+    """List files in directory ending with suffix."""
+    with os.scandir(directory) as it:
+        return [e for e in it if e.name.endswith(suffix) and e.is_file()]
+
+
 def get_all_posts() -> list[dict]:
     """Get all posts from markdown sources and existing HTML files, sorted by date descending."""
     posts = []
     seen_slugs = set()
 
-    # First, get posts from markdown sources (these take priority)
+    # First, get posts from markdown sources (these take priority).
+    # Frontmatter is only re-parsed when the source mtime changed.
     if POSTS_DIR.exists():
-        for md_file in POSTS_DIR.glob("*.md"):
-            content = md_file.read_text()
-            frontmatter, body = parse_frontmatter(content)
-
-            slug = get_slug_from_filename(md_file.name)
-            date = frontmatter.get("date", "")
-
-            # Try to extract date from filename if not in frontmatter
-            if not date:
-                match = re.match(r'(\d{4}-\d{2}-\d{2})-', md_file.name)
-                if match:
-                    date = match.group(1)
-                else:
-                    date = "1970-01-01"
+        cache = load_meta_cache()
+        new_cache = {}
+        for dir_entry in scan_files(POSTS_DIR, ".md"):
+            md_file = Path(dir_entry.path)
+            key = dir_entry.name
+            mtime = dir_entry.stat().st_mtime
+            entry = cache.get(key)
+            if entry is None or entry["mtime"] != mtime:
+                entry = {"mtime": mtime, **extract_metadata_from_markdown(md_file)}
+            new_cache[key] = entry
 
             posts.append({
-                "title": frontmatter.get("title", slug.replace("-", " ")),
-                "date": date,
-                "description": frontmatter.get("description", ""),
-                "slug": slug,
+                "title": entry["title"],
+                "title_esc": entry["title_esc"],
+                "date": entry["date"],
+                "description": entry["description"],
+                "description_esc": entry["description_esc"],
+                "slug": entry["slug"],
                 "file": md_file,
-                "body": body,
+                "mtime": mtime,
                 "source": "markdown"
             })
-            seen_slugs.add(slug)
+            seen_slugs.add(entry["slug"])
+
+        if new_cache != cache:
+            save_meta_cache(new_cache)
 
     # Then, add existing HTML posts that don't have markdown sources
     if THOUGHTS_DIR.exists():
-        for html_file in THOUGHTS_DIR.glob("*.html"):
-            slug = html_file.stem
+        for dir_entry in scan_files(THOUGHTS_DIR, ".html"):
+            slug = dir_entry.name[:-len(".html")]
             if slug not in seen_slugs:
-                post = extract_metadata_from_html(html_file)
+                post = extract_metadata_from_html(Path(dir_entry.path))
                 posts.append(post)
                 seen_slugs.add(slug)
 
@@ -356,60 +532,169 @@ def update_index(posts: list[dict]):
 
     new_posts_block = "\n".join(posts_html)
 
-    # Replace the posts list in the thoughts section
-    pattern = r'(<section id="thoughts">.*?<ul class="posts">)(.*?)(</ul>)'
-    replacement = rf'\1\n{new_posts_block}\n            \3'
+    # Splice the posts list into the thoughts section
+    section = index_content.find('<section id="thoughts">')
+    start = index_content.find('<ul class="posts">', section) if section >= 0 else -1
+    end = index_content.find("</ul>", start) if start >= 0 else -1
+    if end < 0:
+        print(f"Warning: thoughts posts list not found in {INDEX_FILE}, skipping index update")
+        return
 
-    new_index = re.sub(pattern, replacement, index_content, flags=re.DOTALL)
+    # Only the list body can change, so compare just that span
+    start += len('<ul class="posts">')
+    new_list = f"\n{new_posts_block}\n            "
+    if index_content[start:end] == new_list:
+        return
 
-    if new_index != index_content:
-        INDEX_FILE.write_text(new_index)
-        print(f"Updated: {INDEX_FILE}")
+    INDEX_FILE.write_text(index_content[:start] + new_list + index_content[end:])
+    print(f"Updated: {INDEX_FILE}")
 
 
 def generate_rss(posts: list[dict]):
-    """Generate RSS feed."""
-    items = []
-
-    for post in posts[:20]:  # Limit to 20 most recent
-        item = f"""    <item>
-      <title>{html.escape(post['title'])}</title>
+    """Generate RSS feed, leaving feed.xml untouched if only the build date would change."""
+    # Everything after <lastBuildDate>
+    buf = io.StringIO()
+    buf.write(_RSS_ATOM_LINK)
+
+    for i, post in enumerate(posts[:20]):  # Limit to 20 most recent
+        if i:
+            buf.write("\n")
+        buf.write(f"""    <item>
+      <title>{post['title_esc']}</title>
       <link>{SITE_URL}/thoughts/{post['slug']}.html</link>
       <guid>{SITE_URL}/thoughts/{post['slug']}.html</guid>
       <pubDate>{format_date_rss(post['date'])}</pubDate>
-      <description>{html.escape(post.get('description', ''))}</description>
-    </item>"""
-        items.append(item)
+      <description>{post['description_esc']}</description>
+    </item>""")
+
+    buf.write(_RSS_FOOTER)
+    tail = buf.getvalue()
+
+    if FEED_FILE.exists():
+        old_rss = FEED_FILE.read_text()
+        if (
+            old_rss.startswith(_RSS_HEADER)
+            and old_rss.endswith(tail)
+            and old_rss[len(_RSS_HEADER):-len(tail)].startswith("    <lastBuildDate>")
+        ):
+            print(f"Unchanged: {FEED_FILE}")
+            return
+
+    build_date = datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000")
+    FEED_FILE.write_text(f"{_RSS_HEADER}    <lastBuildDate>{build_date}</lastBuildDate>\n{tail}")
+    print(f"Generated: {FEED_FILE}")
 
-    rss = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
-  <channel>
-    <title>{SITE_TITLE}</title>
-    <link>{SITE_URL}</link>
-    <description>{SITE_DESCRIPTION}</description>
-    <language>en-us</language>
-    <lastBuildDate>{datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000")}</lastBuildDate>
-    <atom:link href="{SITE_URL}/feed.xml" rel="self" type="application/rss+xml"/>
-{chr(10).join(items)}
-  </channel>
-</rss>"""
 
-    FEED_FILE.write_text(rss)
-    print(f"Generated: {FEED_FILE}")
+def load_build_stamps() -> dict:
+    """Load the (source mtime, deps mtime) each post was last rendered against, keyed by slug."""
+    try:
+        return json.loads(BUILD_STAMP_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_stamps(stamps: dict):
+    """Persist post build stamps."""
+    write_cache_file(BUILD_STAMP_FILE, json.dumps(stamps, indent=2, sort_keys=True))
+
 
+def is_up_to_date(stamp: Optional[list], src_mtime: float, slug: str, deps_mtime: float) -> bool:
+    """Check if a post's HTML was rendered from its current source and build inputs.
 
-def rebuild_all():
-    """Rebuild all posts from markdown sources."""
+    Freshness comes from the build stamp, not the output's mtime, so unchanged
+    outputs never need to be touched.
+    """
+    return stamp == [src_mtime, deps_mtime] and (THOUGHTS_DIR / f"{slug}.html").exists()
+
+
+def posts_digest(posts: list[dict]) -> str:
+    """Hash the post fields that end up in index.html and feed.xml, plus the publish.py version."""
+    key = repr((script_mtime(), [(p["slug"], p["title"], p["date"], p["description"]) for p in posts]))
+    return hashlib.blake2b(key.encode()).hexdigest()
+
+
+def listings_state(digest: str) -> dict:
+    """Post digest plus the (mtime_ns, size) of index.html and feed.xml as they are now."""
+    state = {"digest": digest}
+    for name, path in (("index", INDEX_FILE), ("feed", FEED_FILE)):
+        try:
+            st = path.stat()
+            state[name] = [st.st_mtime_ns, st.st_size]
+        except FileNotFoundError:
+            state[name] = None
+    return state
+
+
+def update_listings(posts: list[dict], force: bool = False):
+    """Update index.html and feed.xml, unless neither the posts nor those files changed since the last run."""
+    digest = posts_digest(posts)
+    try:
+        last_state = json.loads(LISTINGS_STATE_FILE.read_text())
+    except (OSError, ValueError):
+        last_state = None
+
+    # A hand-edited, reverted or deleted output no longer matches its recorded stat
+    state = listings_state(digest)
+    if not force and state == last_state and state["index"] and state["feed"]:
+        print("Index and RSS unchanged")
+        return
+
+    update_index(posts)
+    generate_rss(posts)
+    write_cache_file(LISTINGS_STATE_FILE, json.dumps(listings_state(digest)))
+
+
+def _publish_one(job: tuple[Path, str]) -> dict:
+    """Publish a single (md_file, template) job; module-level so it pickles."""
+    md_file, template = job
+    return publish_post(md_file, template=template)
+
+
+def ensure_output_dir():
+    """Create the thoughts/ output directory once, before any post is written."""
+    THOUGHTS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def rebuild_all(force: bool = False):
+    """Rebuild posts from markdown sources, skipping unchanged ones unless forced."""
+    ensure_output_dir()
     posts = get_all_posts()
 
     # Only rebuild posts that have markdown sources
     markdown_posts = [p for p in posts if p.get("source") == "markdown"]
-    for post in markdown_posts:
-        publish_post(post["file"])
 
-    update_index(posts)
-    generate_rss(posts)
-    print(f"\nRebuilt {len(markdown_posts)} posts from markdown sources")
+    # A newer template or publish.py invalidates every post
+    template_file = TEMPLATES_DIR / "post.html"
+    deps_mtime = script_mtime()
+    if template_file.exists():
+        deps_mtime = max(deps_mtime, template_file.stat().st_mtime)
+
+    stamps = load_build_stamps()
+    stale = [
+        p for p in markdown_posts
+        if force or not is_up_to_date(stamps.get(p["slug"]), p["mtime"], p["slug"], deps_mtime)
+    ]
+
+    # Posts render independently; only spin up a process pool when it pays off
+    if stale:
+        template = load_template()
+        jobs = [(p["file"], template) for p in stale]
+        if len(stale) > 4:
+            with ProcessPoolExecutor() as ex:
+                list(ex.map(_publish_one, jobs))
+        else:
+            for job in jobs:
+                _publish_one(job)
+
+    # Drop stamps for removed posts, record the ones just rendered
+    new_stamps = {p["slug"]: stamps[p["slug"]] for p in markdown_posts if p["slug"] in stamps}
+    new_stamps.update({p["slug"]: [p["mtime"], deps_mtime] for p in stale})
+    if new_stamps != stamps:
+        save_build_stamps(new_stamps)
+    rebuilt = len(stale)
+
+    update_listings(posts, force=force)
+    print(f"\nRebuilt {rebuilt} of {len(markdown_posts)} posts from markdown sources")
     print(f"Total posts in index: {len(posts)}")
 
 
@@ -426,7 +711,7 @@ def main():
         return
 
     if arg == "--rebuild":
-        rebuild_all()
+        rebuild_all(force="--force" in sys.argv)
         return
 
     # Publishing a specific post
@@ -440,6 +725,8 @@ def main():
         sys.exit(1)
 
     substack = "--substack" in sys.argv
+    if not substack:
+        ensure_output_dir()
 
     # Publish the post
     post_info = publish_post(md_file, substack=substack)
@@ -447,8 +734,7 @@ def main():
     if not substack:
         # Update index and RSS with all posts
         posts = get_all_posts()
-        update_index(posts)
-        generate_rss(posts)
+        update_listings(posts)
 
     print("\nDone!")
 